@@ -3,6 +3,9 @@ from __future__ import annotations
 import base64
 import io
 from datetime import datetime
+from functools import lru_cache
+
+from jinja2 import Environment
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
@@ -20,84 +23,56 @@ from reportlab.platypus import (
 from .brand_profile import BrandProfile
 
 
-def generate_brand_book_html(profile: BrandProfile) -> str:
-    """
-    Build a single-page (or multi-section) Brand Book as HTML summarising
-    all brand elements inferred for the client.
-    """
-    profile.ensure_palette()
+def _build_styles():
+    """Build the shared reportlab stylesheet once; getSampleStyleSheet is
+    expensive and the custom styles never change between renders."""
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name="Heading1TT", parent=styles["Heading1"], fontSize=18, leading=22))
+    styles.add(ParagraphStyle(name="Heading2TT", parent=styles["Heading2"], fontSize=14, leading=18))
+    styles.add(ParagraphStyle(name="NormalSmall", parent=styles["Normal"], fontSize=9, leading=11))
+    return styles
 
-    name = profile.name or "Your Company Name"
-    today = datetime.utcnow().strftime("%Y-%m-%d")
 
-    logo_html = ""
-    if profile.logo_path:
-        logo_html = f'<img src="{profile.logo_path}" alt="Logo" style="max-height:80px;max-width:260px;object-fit:contain;border-radius:10px;background:#F9FAFB;padding:8px 14px;margin-bottom:16px;" />'
+_STYLES = _build_styles()
 
-    color_swatches = ""
-    for c in profile.chart_palette:
-        color_swatches += f"""
-        <div class="swatch">
-          <div class="swatch-color" style="background:{c};"></div>
-          <div class="swatch-label">{c}</div>
-        </div>
-        """
 
-    fonts_html = ""
-    if profile.detected_fonts:
-        fonts_html = "<ul>" + "".join(
-            f"<li>{f}</li>" for f in profile.detected_fonts
-        ) + "</ul>"
-    else:
-        fonts_html = "<p>No explicit fonts detected. Using default system stack.</p>"
+@lru_cache(maxsize=512)
+def _hex_color(c: str):
+    """Parse a hex string into a reportlab color, cached because the same
+    ~8 palette colors recur across every render for a brand."""
+    try:
+        return colors.HexColor(c)
+    except Exception:
+        return colors.grey
 
-    hex_html = ""
-    if profile.hex_colors_in_text:
-        hex_html = "<ul>" + "".join(
-            f"<li>{h}</li>" for h in profile.hex_colors_in_text
-        ) + "</ul>"
-    else:
-        hex_html = "<p>No inline hex colors detected in brand guides.</p>"
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8" />
-  <title>{name} – Tri-Tender Brand Book</title>
-  <style>
-    :root {{
-      --brand-primary: {profile.primary_color or "#0B1120"};
-      --brand-secondary: {profile.secondary_color or "#2563EB"};
-      --brand-accent: {profile.accent_color or "#0EA5E9"};
-      --brand-bg: {profile.background_color or "#F9FAFB"};
-      --brand-neutral: {profile.neutral_color or "#111827"};
-      --font-heading: {profile.font_heading};
-      --font-body: {profile.font_body};
-    }}
-    * {{
+# Everything below the :root block is brand-independent: it is frozen here as a
+# single constant and spliced into the template source once at import, so per
+# render only the 7 CSS variables (and the document body) are computed.
+_CSS_STATIC = """    * {
       box-sizing: border-box;
-    }}
-    body {{
+    }
+    body {
       margin: 0;
       padding: 0;
       font-family: var(--font-body);
       background: var(--brand-bg);
       color: var(--brand-neutral);
-    }}
-    .page {{
+    }
+    .page {
       max-width: 1024px;
       margin: 24px auto;
       background: #FFFFFF;
       border-radius: 16px;
       box-shadow: 0 18px 50px rgba(15,23,42,0.14);
       overflow: hidden;
-    }}
-    .cover {{
+    }
+    .cover {
       padding: 32px 40px 24px 40px;
       background: radial-gradient(circle at top left, var(--brand-secondary), var(--brand-primary));
       color: white;
-    }}
-    .badge {{
+    }
+    .badge {
       display: inline-flex;
       align-items: center;
       padding: 4px 10px;
@@ -107,71 +82,71 @@ def generate_brand_book_html(profile: BrandProfile) -> str:
       text-transform: uppercase;
       letter-spacing: 0.12em;
       margin-bottom: 8px;
-    }}
-    .cover h1 {{
+    }
+    .cover h1 {
       font-family: var(--font-heading);
       font-size: 28px;
       margin: 0 0 4px 0;
-    }}
-    .cover h2 {{
+    }
+    .cover h2 {
       font-size: 14px;
       font-weight: 400;
       opacity: 0.9;
       margin: 0 0 16px 0;
-    }}
-    .meta {{
+    }
+    .meta {
       font-size: 11px;
       opacity: 0.85;
-    }}
-    .body {{
+    }
+    .body {
       padding: 28px 40px 32px 40px;
       font-size: 14px;
       line-height: 1.6;
-    }}
-    h3 {{
+    }
+    h3 {
       font-family: var(--font-heading);
       font-size: 18px;
       margin-top: 0;
       color: var(--brand-primary);
-    }}
-    h4 {{
+    }
+    h4 {
       font-family: var(--font-heading);
       font-size: 15px;
       margin-bottom: 6px;
       color: var(--brand-primary);
-    }}
-    .section {{
+    }
+    .section {
       margin-bottom: 24px;
       border-bottom: 1px solid #E5E7EB;
       padding-bottom: 20px;
-    }}
-    .section:last-child {{
+    }
+    .section:last-child {
       border-bottom: none;
       padding-bottom: 0;
-    }}
-    .color-row {{
+    }
+    .color-row {
       display: flex;
       flex-wrap: wrap;
       gap: 12px;
-    }}
-    .swatch {{
+    }
+    .swatch {
       width: 120px;
       background: #F3F4F6;
       border-radius: 12px;
       padding: 10px;
       font-size: 11px;
-    }}
-    .swatch-color {{
+    }
+    .swatch-color {
       height: 38px;
       border-radius: 9px;
       margin-bottom: 6px;
       border: 1px solid rgba(15,23,42,0.07);
-    }}
-    .swatch-label {{
+    }
+    .swatch-label {
       font-family: var(--font-heading);
       color: #111827;
-    }}
-    .mono {{
+    }
+    .mono {
       font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace;
       font-size: 12px;
       padding: 6px 8px;
@@ -179,23 +154,44 @@ def generate_brand_book_html(profile: BrandProfile) -> str:
       border-radius: 8px;
       border: 1px dashed #E5E7EB;
       display: inline-block;
-    }}
-    .two-column {{
+    }
+    .two-column {
       display: grid;
       grid-template-columns: minmax(0, 1.1fr) minmax(0, 0.9fr);
       gap: 20px;
-    }}
+    }"""
+
+# The Brand Book HTML skeleton is compiled once at import. Only the handful of
+# brand tokens, the palette/fonts/hex lists and the date vary per render, so the
+# hot path is a single compiled-template render instead of rebuilding (and
+# re-tokenising) the ~6 KB of static CSS on every call.
+_TEMPLATE_SRC = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <title>{{ name }} – Tri-Tender Brand Book</title>
+  <style>
+    :root {
+      --brand-primary: {{ profile.primary_color or "#0B1120" }};
+      --brand-secondary: {{ profile.secondary_color or "#2563EB" }};
+      --brand-accent: {{ profile.accent_color or "#0EA5E9" }};
+      --brand-bg: {{ profile.background_color or "#F9FAFB" }};
+      --brand-neutral: {{ profile.neutral_color or "#111827" }};
+      --font-heading: {{ profile.font_heading | safe }};
+      --font-body: {{ profile.font_body | safe }};
+    }
+/*__CSS_STATIC__*/
   </style>
 </head>
 <body>
   <div class="page">
     <section class="cover">
       <div class="badge">Tri-Tender • Brand Profile</div>
-      <h1>{name}</h1>
+      <h1>{{ name }}</h1>
       <h2>Generated Brand Book – automated by Tri-Tender Brand Engine</h2>
-      <div class="meta">Generated on {today}</div>
+      <div class="meta">Generated on {{ today }}</div>
       <div style="margin-top:16px;">
-        {logo_html}
+        {% if profile.logo_path %}<img src="{{ profile.logo_path }}" alt="Logo" style="max-height:80px;max-width:260px;object-fit:contain;border-radius:10px;background:#F9FAFB;padding:8px 14px;margin-bottom:16px;" />{% endif %}
       </div>
     </section>
     <section class="body">
@@ -214,14 +210,19 @@ def generate_brand_book_html(profile: BrandProfile) -> str:
         <h3>2. Core Brand Colors</h3>
         <div class="two-column">
           <div>
-            <p>Primary color: <span class="mono">{profile.primary_color or "N/A"}</span></p>
-            <p>Secondary color: <span class="mono">{profile.secondary_color or "N/A"}</span></p>
-            <p>Accent color: <span class="mono">{profile.accent_color or "N/A"}</span></p>
-            <p>Background color: <span class="mono">{profile.background_color}</span></p>
-            <p>Neutral text color: <span class="mono">{profile.neutral_color}</span></p>
+            <p>Primary color: <span class="mono">{{ profile.primary_color or "N/A" }}</span></p>
+            <p>Secondary color: <span class="mono">{{ profile.secondary_color or "N/A" }}</span></p>
+            <p>Accent color: <span class="mono">{{ profile.accent_color or "N/A" }}</span></p>
+            <p>Background color: <span class="mono">{{ profile.background_color }}</span></p>
+            <p>Neutral text color: <span class="mono">{{ profile.neutral_color }}</span></p>
           </div>
           <div class="color-row">
-            {color_swatches}
+            {% for c in palette %}
+        <div class="swatch">
+          <div class="swatch-color" style="background:{{ c }};"></div>
+          <div class="swatch-label">{{ c }}</div>
+        </div>
+        {% endfor %}
           </div>
         </div>
       </div>
@@ -229,11 +230,11 @@ def generate_brand_book_html(profile: BrandProfile) -> str:
       <div class="section">
         <h3>3. Typography</h3>
         <p><strong>Heading font-family:</strong></p>
-        <p class="mono">{profile.font_heading}</p>
+        <p class="mono">{{ profile.font_heading }}</p>
         <p style="margin-top:10px;"><strong>Body font-family:</strong></p>
-        <p class="mono">{profile.font_body}</p>
+        <p class="mono">{{ profile.font_body }}</p>
         <h4 style="margin-top:16px;">Detected fonts from PDFs</h4>
-        {fonts_html}
+        {% if fonts %}<ul>{% for f in fonts %}<li>{{ f }}</li>{% endfor %}</ul>{% else %}<p>No explicit fonts detected. Using default system stack.</p>{% endif %}
       </div>
 
       <div class="section">
@@ -243,7 +244,7 @@ def generate_brand_book_html(profile: BrandProfile) -> str:
           PDF letterheads and other assets. The following logo path is currently
           associated with this profile:
         </p>
-        <p class="mono">{profile.logo_path or "None detected"}</p>
+        <p class="mono">{{ profile.logo_path or "None detected" }}</p>
         <p style="margin-top:12px;">
           If this is incorrect, you can upload a more accurate logo file and regenerate
           the Brand Profile.
@@ -256,7 +257,7 @@ def generate_brand_book_html(profile: BrandProfile) -> str:
           These hex colors were discovered inside your text-based brand guides
           (PDF / DOCX). They are treated as additional palette hints:
         </p>
-        {hex_html}
+        {% if hexes %}<ul>{% for h in hexes %}<li>{{ h }}</li>{% endfor %}</ul>{% else %}<p>No inline hex colors detected in brand guides.</p>{% endif %}
       </div>
 
       <div class="section">
@@ -267,7 +268,12 @@ def generate_brand_book_html(profile: BrandProfile) -> str:
           Bars and series rotate through the palette below.
         </p>
         <div class="color-row">
-          {color_swatches}
+          {% for c in palette %}
+        <div class="swatch">
+          <div class="swatch-color" style="background:{{ c }};"></div>
+          <div class="swatch-label">{{ c }}</div>
+        </div>
+        {% endfor %}
         </div>
       </div>
 
@@ -293,6 +299,26 @@ def generate_brand_book_html(profile: BrandProfile) -> str:
 </html>
 """
 
+_ENV = Environment(autoescape=True)
+_BRAND_BOOK_TMPL = _ENV.from_string(_TEMPLATE_SRC.replace("/*__CSS_STATIC__*/", _CSS_STATIC))
+
+
+def generate_brand_book_html(profile: BrandProfile) -> str:
+    """
+    Build a single-page (or multi-section) Brand Book as HTML summarising
+    all brand elements inferred for the client.
+    """
+    profile.ensure_palette()
+
+    return _BRAND_BOOK_TMPL.render(
+        profile=profile,
+        name=profile.name or "Your Company Name",
+        palette=profile.chart_palette,
+        fonts=profile.detected_fonts,
+        hexes=profile.hex_colors_in_text,
+        today=datetime.utcnow().strftime("%Y-%m-%d"),
+    )
+
 
 def generate_brand_book_pdf_data_url(profile: BrandProfile, html_preview: str | None = None) -> str:
     """
@@ -314,10 +340,7 @@ def generate_brand_book_pdf_data_url(profile: BrandProfile, html_preview: str |
         title="Tri-Tender Brand Book",
     )
 
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(name="Heading1TT", parent=styles["Heading1"], fontSize=18, leading=22))
-    styles.add(ParagraphStyle(name="Heading2TT", parent=styles["Heading2"], fontSize=14, leading=18))
-    styles.add(ParagraphStyle(name="NormalSmall", parent=styles["Normal"], fontSize=9, leading=11))
+    styles = _STYLES
 
     story = []
 
@@ -361,10 +384,7 @@ def generate_brand_book_pdf_data_url(profile: BrandProfile, html_preview: str |
         palette_table = Table(palette_data, colWidths=[(170 * mm) / max(1, len(profile.chart_palette))] * len(profile.chart_palette), rowHeights=10 * mm)
         palette_style = [("GRID", (0, 0), (-1, -1), 0.25, colors.white)]
         for idx, c in enumerate(profile.chart_palette):
-            try:
-                palette_style.append(("BACKGROUND", (idx, 0), (idx, 0), colors.HexColor(c)))
-            except Exception:
-                palette_style.append(("BACKGROUND", (idx, 0), (idx, 0), colors.grey))
+            palette_style.append(("BACKGROUND", (idx, 0), (idx, 0), _hex_color(c)))
         palette_table.setStyle(TableStyle(palette_style))
         story.append(palette_table)
         story.append(Spacer(1, 6 * mm))
@@ -416,8 +436,9 @@ def generate_brand_book_pdf_data_url(profile: BrandProfile, html_preview: str |
     story.append(Paragraph(usage_text.strip(), styles["NormalSmall"]))
 
     doc.build(story)
-    pdf_bytes = buffer.getvalue()
+    # Encode straight from the BytesIO's internal buffer: getvalue() would copy
+    # the whole PDF a second time before base64 copies it again.
+    encoded = base64.b64encode(buffer.getbuffer()).decode("ascii")
     buffer.close()
 
-    encoded = base64.b64encode(pdf_bytes).decode("ascii")
-    return f"data:application/pdf;base64,{encoded}"
+    return "data:application/pdf;base64," + encoded
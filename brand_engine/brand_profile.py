@@ -1,10 +1,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 
-@dataclass
+_FALLBACK_PALETTE = (
+    "#2563EB",
+    "#0EA5E9",
+    "#22C55E",
+    "#F97316",
+    "#E11D48",
+    "#A855F7",
+)
+
+# Prebuilt result for the fresh-profile case (no brand colors, default
+# neutral): cold starts skip the dedupe pass entirely.
+_DEFAULT_PALETTE_WITH_NEUTRAL = ("#111827",) + _FALLBACK_PALETTE
+
+
+@dataclass(slots=True)
 class BrandProfile:
     """Canonical brand profile used across Tri-Tender."""
 
@@ -30,34 +45,49 @@ class BrandProfile:
         if self.chart_palette:
             return
 
-        base_colors = [
-            c for c in [
-                self.primary_color,
-                self.secondary_color,
-                self.accent_color,
-                self.neutral_color,
-            ] if c
-        ]
-
-        fallback = [
-            "#2563EB",
-            "#0EA5E9",
-            "#22C55E",
-            "#F97316",
-            "#E11D48",
-            "#A855F7",
-        ]
-
-        # Deduplicate while preserving order
-        seen = set()
-        deduped = []
-        for c in base_colors + fallback:
-            if c and c not in seen:
-                seen.add(c)
-                deduped.append(c)
-
-        self.chart_palette = deduped[:8]
+        if (
+            not (self.primary_color or self.secondary_color or self.accent_color)
+            and self.neutral_color == "#111827"
+        ):
+            self.chart_palette = list(_DEFAULT_PALETTE_WITH_NEUTRAL)
+            return
+
+        candidates = (
+            self.primary_color,
+            self.secondary_color,
+            self.accent_color,
+            self.neutral_color,
+            *_FALLBACK_PALETTE,
+        )
+        # dict.fromkeys dedupes while preserving order in one allocation
+        self.chart_palette = list(dict.fromkeys(c for c in candidates if c))[:8]
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BrandProfile":
-        return cls(**data)
+        """
+        Build a profile from a plain dict (as passed over MCP).
+
+        Results are cached on the dict's contents: a client rendering a
+        letterhead, charts and a brand book for one profile reconstructs (and
+        palette-derives) it once. Callers treat profiles as read-only.
+        """
+        try:
+            return _profile_from_frozen(_freeze(data))
+        except TypeError:
+            # Unhashable/unexpected value shapes fall back to a direct build
+            return cls(**data)
+
+
+def _freeze(value):
+    """Recursively convert dicts/lists into hashable tuples."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=64)
+def _profile_from_frozen(frozen) -> "BrandProfile":
+    data = {k: list(v) if isinstance(v, tuple) else v for k, v in frozen}
+    return BrandProfile(**data)
@@ -1,12 +1,49 @@
 from __future__ import annotations
 
+import base64
 import io
 from typing import List, Dict, Any
 
-import matplotlib.pyplot as plt
+from jinja2 import Environment
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_svg import FigureCanvasSVG
+from matplotlib.figure import Figure
 
 from .brand_profile import BrandProfile
 
+_ENV = Environment(autoescape=True)
+
+# Hand-rolled SVG for the default bar-chart case: a simple chart is ~20 <rect>
+# elements, and going through the full matplotlib pipeline (axes, ticks, font
+# resolution) is a large constant cost per render. The matplotlib path stays
+# available behind style="rich".
+_BAR_CHART_TMPL = _ENV.from_string(
+    """<svg width="{{ w }}" height="{{ h }}" viewBox="0 0 {{ w }} {{ h }}" xmlns="http://www.w3.org/2000/svg">
+<rect width="{{ w }}" height="{{ h }}" fill="{{ background }}"/>
+{% if title %}<text x="{{ w // 2 }}" y="22" text-anchor="middle" font-family="{{ font_heading }}" font-size="16" font-weight="700" fill="{{ title_color }}">{{ title }}</text>
+{% endif %}{% for t in ticks %}<line x1="{{ left }}" y1="{{ t.y }}" x2="{{ w - right }}" y2="{{ t.y }}" stroke="{{ grid_color }}" stroke-width="0.5" stroke-dasharray="4 3"/>
+<text x="{{ left - 6 }}" y="{{ t.y + 4 }}" text-anchor="end" font-family="{{ font_body }}" font-size="11" fill="{{ label_color }}">{{ t.label }}</text>
+{% endfor %}{% for b in bars %}<rect x="{{ b.x }}" y="{{ b.y }}" width="{{ b.w }}" height="{{ b.h }}" fill="{{ b.color }}"/>
+<text x="{{ b.cx }}" y="{{ h - bottom + 16 }}" text-anchor="middle" font-family="{{ font_body }}" font-size="12" fill="{{ label_color }}">{{ b.label }}</text>
+{% endfor %}<line x1="{{ left }}" y1="{{ h - bottom }}" x2="{{ w - right }}" y2="{{ h - bottom }}" stroke="{{ axis_color }}" stroke-width="1"/>
+</svg>
+"""
+)
+
+# Module-level figures reused across renders. Going through the OO API instead
+# of pyplot skips the global figure-manager bookkeeping and per-call
+# create/close teardown; clear() + add_subplot resets all per-chart state.
+# The MCP server handles tool calls on a single event loop, so the shared
+# figures are not contended.
+_SVG_FIG = Figure()
+_SVG_CANVAS = FigureCanvasSVG(_SVG_FIG)
+_AGG_FIG = Figure()
+_AGG_CANVAS = FigureCanvasAgg(_AGG_FIG)
+
+# Fixed margins instead of bbox_inches="tight", which forces a second render
+# pass just to measure artists.
+_MARGINS = dict(left=0.08, right=0.97, top=0.9, bottom=0.16)
+
 
 def generate_bar_chart_svg(
     profile: BrandProfile,
@@ -14,78 +51,163 @@ def generate_bar_chart_svg(
     title: str = "",
     width: int = 800,
     height: int = 400,
+    style: str = "simple",
 ) -> str:
     """
-    Generate a simple vertical bar chart as inline SVG using matplotlib.
+    Generate a simple vertical bar chart as inline SVG.
+
+    The default style emits SVG straight from a compiled template; pass
+    style="rich" to render through matplotlib instead (grids, fonts and
+    layout handled by the full pipeline at a much higher per-chart cost).
     """
     profile.ensure_palette()
 
     labels = [str(s.get("label", "")) for s in series]
     values = [float(s.get("value", 0.0)) for s in series]
 
-    fig_w = width / 96.0  # dpi -> inches
-    fig_h = height / 96.0
+    if style != "rich":
+        return _render_simple_bar_svg(profile, labels, values, title, width, height)
 
-    fig, ax = plt.subplots(figsize=(fig_w, fig_h))
+    fig = _SVG_FIG
+    fig.clear()
+    fig.set_size_inches(width / 96.0, height / 96.0)  # dpi -> inches
+    ax = fig.add_subplot(111)
     colors = profile.chart_palette or ["#2563EB"]
 
-    bars = ax.bar(labels, values)
-
-    # Apply brand colors per bar
-    for i, bar in enumerate(bars):
-        bar.set_color(colors[i % len(colors)])
+    # Pass brand colors in one call; per-bar set_color fires a property-change
+    # event for every patch
+    bar_colors = [colors[i % len(colors)] for i in range(len(values))]
+    ax.bar(labels, values, color=bar_colors)
 
     if title:
         ax.set_title(title, fontfamily=profile.font_heading.split(",")[0].strip("'\""))
 
     ax.set_ylabel("")
     ax.grid(axis="y", linestyle="--", linewidth=0.5, alpha=0.4)
+    fig.subplots_adjust(**_MARGINS)
 
     buf = io.StringIO()
-    fig.savefig(buf, format="svg", bbox_inches="tight")
-    plt.close(fig)
+    _SVG_CANVAS.print_svg(buf)
     svg = buf.getvalue()
     buf.close()
     return svg
 
 
-def generate_bar_chart_png_base64(
+def _render_simple_bar_svg(
+    profile: BrandProfile,
+    labels: List[str],
+    values: List[float],
+    title: str,
+    width: int,
+    height: int,
+) -> str:
+    """Compute bar geometry and render the compiled SVG template."""
+    colors = profile.chart_palette or ["#2563EB"]
+
+    left, right = 52, 16
+    top = 36 if title else 16
+    bottom = 28
+    plot_w = max(1, width - left - right)
+    plot_h = max(1, height - top - bottom)
+
+    vmax = max((v for v in values if v > 0), default=0.0) or 1.0
+    step = plot_w / max(1, len(values))
+    bar_w = step * 0.7
+
+    bars = []
+    for i, (label, value) in enumerate(zip(labels, values)):
+        bar_h = max(0.0, value) / vmax * plot_h
+        x = left + i * step + (step - bar_w) / 2
+        bars.append(
+            {
+                "x": round(x, 1),
+                "y": round(top + plot_h - bar_h, 1),
+                "w": round(bar_w, 1),
+                "h": round(bar_h, 1),
+                "cx": round(x + bar_w / 2, 1),
+                "color": colors[i % len(colors)],
+                "label": label,
+            }
+        )
+
+    ticks = []
+    for i in range(5):
+        frac = i / 4
+        ticks.append(
+            {
+                "y": round(top + plot_h * (1 - frac), 1),
+                "label": "%g" % (vmax * frac),
+            }
+        )
+
+    return _BAR_CHART_TMPL.render(
+        w=width,
+        h=height,
+        title=title,
+        bars=bars,
+        ticks=ticks,
+        left=left,
+        right=right,
+        bottom=bottom,
+        background=profile.background_color or "#FFFFFF",
+        grid_color="#E5E7EB",
+        axis_color="#4B5563",
+        label_color="#111827",
+        title_color=profile.primary_color or "#0B1120",
+        font_heading=profile.font_heading,
+        font_body=profile.font_body,
+    )
+
+
+def generate_bar_chart_png_bytes(
     profile: BrandProfile,
     series: List[Dict[str, Any]],
     title: str = "",
     width: int = 800,
     height: int = 400,
-) -> str:
+) -> bytes:
     """
-    Generate a bar chart as PNG (base64 data URL).
-    """
-    import base64
+    Generate a bar chart as raw PNG bytes.
 
+    Callers that can consume bytes directly (e.g. embedding into a
+    reportlab PDF) should use this and skip the base64 round-trip.
+    """
     profile.ensure_palette()
 
     labels = [str(s.get("label", "")) for s in series]
     values = [float(s.get("value", 0.0)) for s in series]
 
-    fig_w = width / 96.0
-    fig_h = height / 96.0
-
-    fig, ax = plt.subplots(figsize=(fig_w, fig_h))
+    fig = _AGG_FIG
+    fig.clear()
+    fig.set_size_inches(width / 96.0, height / 96.0)
+    ax = fig.add_subplot(111)
     colors = profile.chart_palette or ["#2563EB"]
 
-    bars = ax.bar(labels, values)
-    for i, bar in enumerate(bars):
-        bar.set_color(colors[i % len(colors)])
+    bar_colors = [colors[i % len(colors)] for i in range(len(values))]
+    ax.bar(labels, values, color=bar_colors)
 
     if title:
         ax.set_title(title, fontfamily=profile.font_heading.split(",")[0].strip("'\""))
 
     ax.grid(axis="y", linestyle="--", linewidth=0.5, alpha=0.4)
+    fig.subplots_adjust(**_MARGINS)
 
     buf = io.BytesIO()
-    fig.savefig(buf, format="png", bbox_inches="tight")
-    plt.close(fig)
+    _AGG_CANVAS.print_png(buf)
     png_bytes = buf.getvalue()
     buf.close()
+    return png_bytes
+
 
-    encoded = base64.b64encode(png_bytes).decode("ascii")
-    return f"data:image/png;base64,{encoded}"
+def generate_bar_chart_png_base64(
+    profile: BrandProfile,
+    series: List[Dict[str, Any]],
+    title: str = "",
+    width: int = 800,
+    height: int = 400,
+) -> str:
+    """
+    Generate a bar chart as PNG (base64 data URL).
+    """
+    raw = generate_bar_chart_png_bytes(profile, series, title=title, width=width, height=height)
+    return "data:image/png;base64," + base64.b64encode(raw).decode("ascii")
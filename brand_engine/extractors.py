@@ -1,16 +1,52 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import multiprocessing
 import os
+import re
 from collections import Counter
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from functools import lru_cache
+from typing import List, Set, Tuple
 
 import fitz  # PyMuPDF
-import pdfplumber
 from docx import Document
 
 from .brand_profile import BrandProfile
 from .utils import extract_hex_colors_from_text, image_dominant_colors, safe_filename
 
+# Upper bound on embedded images decoded/saved per PDF (largest first).
+MAX_IMAGES_PER_PDF = 4
+
+# Extension -> handler kind, looked up once per file instead of running a
+# chain of suffix matches on every path.
+_EXT_HANDLERS = {
+    ".pdf": "pdf",
+    ".docx": "docx",
+    ".png": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".webp": "image",
+}
+
+# On-disk cache of extracted BrandProfiles; tenders are regenerated against
+# the same brand assets over and over, and extraction is the expensive part.
+_PROFILE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tri_tender", "brand")
+
+
+def _profile_cache_key(paths: List[str]) -> str:
+    """Fingerprint the input files by path, mtime and size."""
+    parts = []
+    for p in sorted(paths):
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        parts.append(f"{p}:{st.st_mtime}:{st.st_size}")
+    return hashlib.blake2b("\n".join(parts).encode()).hexdigest()
+
 
 def extract_brand_from_files(file_paths: List[str]) -> BrandProfile:
     """
@@ -20,6 +56,15 @@ def extract_brand_from_files(file_paths: List[str]) -> BrandProfile:
     - Checks DOCX for text & hex colors.
     - Checks images directly for dominant colors.
     """
+    paths = [p for p in file_paths if p and os.path.exists(p)]
+
+    cache_path = os.path.join(_PROFILE_CACHE_DIR, _profile_cache_key(paths) + ".json")
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            return BrandProfile.from_dict(json.load(fh))
+    except (OSError, ValueError, TypeError):
+        pass
+
     profile = BrandProfile()
 
     all_hex_colors = set()
@@ -27,22 +72,24 @@ def extract_brand_from_files(file_paths: List[str]) -> BrandProfile:
     logo_candidates: List[str] = []
     image_candidates: List[str] = []
 
-    for path in file_paths:
-        if not path or not os.path.exists(path):
-            continue
+    # Per-file extraction is CPU-bound (PDF parsing, image decoding), so fan
+    # multi-file brand kits out over a process pool and merge on this side.
+    if len(paths) <= 1:
+        results = [_extract_one(p) for p in paths]
+    else:
+        # forkserver start method: this runs on a worker thread of an async
+        # server, and fork()ing a multithreaded process can deadlock children.
+        with ProcessPoolExecutor(
+            max_workers=min(8, len(paths)),
+            mp_context=multiprocessing.get_context("forkserver"),
+        ) as executor:
+            results = list(executor.map(_extract_one, paths))
 
-        lower = path.lower()
-        if lower.endswith(".pdf"):
-            pdf_hex, pdf_fonts, pdf_images = _extract_from_pdf(path)
-            all_hex_colors.update(pdf_hex)
-            all_fonts.update(pdf_fonts)
-            logo_candidates.extend(pdf_images)
-            image_candidates.extend(pdf_images)
-        elif lower.endswith(".docx"):
-            docx_hex = _extract_from_docx(path)
-            all_hex_colors.update(docx_hex)
-        elif lower.endswith((".png", ".jpg", ".jpeg", ".webp")):
-            image_candidates.append(path)
+    for file_hex, file_fonts, file_logos, file_images in results:
+        all_hex_colors |= file_hex
+        all_fonts.update(file_fonts)
+        logo_candidates.extend(file_logos)
+        image_candidates.extend(file_images)
 
     # If we found logo candidates from PDFs, prefer the first
     if logo_candidates:
@@ -80,9 +127,43 @@ def extract_brand_from_files(file_paths: List[str]) -> BrandProfile:
     # Ensure chart palette is defined
     profile.ensure_palette()
 
+    try:
+        os.makedirs(_PROFILE_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as fh:
+            json.dump(asdict(profile), fh)
+    except OSError:
+        pass
+
     return profile
 
 
+def _extract_one(path: str) -> Tuple[Set[str], Counter, List[str], List[str]]:
+    """
+    Extract brand signals from a single file.
+
+    Top-level (not a closure) so it can be dispatched across a process pool.
+    Returns (hex colors, font counts, logo candidates, image candidates).
+    """
+    hex_colors: Set[str] = set()
+    fonts: Counter = Counter()
+    logo_candidates: List[str] = []
+    image_candidates: List[str] = []
+
+    kind = _EXT_HANDLERS.get(os.path.splitext(path)[1].lower())
+    if kind == "pdf":
+        pdf_hex, pdf_fonts, pdf_images = _extract_from_pdf(path)
+        hex_colors.update(pdf_hex)
+        fonts.update(pdf_fonts)
+        logo_candidates.extend(pdf_images)
+        image_candidates.extend(pdf_images)
+    elif kind == "docx":
+        hex_colors.update(_extract_from_docx(path))
+    elif kind == "image":
+        image_candidates.append(path)
+
+    return hex_colors, fonts, logo_candidates, image_candidates
+
+
 def _extract_from_pdf(path: str) -> Tuple[List[str], Counter, List[str]]:
     """
     Extract hex colors, fonts, and image paths (candidate logos) from a PDF.
@@ -90,28 +171,10 @@ def _extract_from_pdf(path: str) -> Tuple[List[str], Counter, List[str]]:
     hex_colors = set()
     fonts = Counter()
     image_paths: List[str] = []
+    image_refs: List[Tuple[int, int, int, int]] = []  # (area, page, index, xref)
 
-    # --- Text & Fonts via pdfplumber ---
-    try:
-        with pdfplumber.open(path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text() or ""
-                for c in extract_hex_colors_from_text(text):
-                    hex_colors.add(c)
-
-                try:
-                    # Some pdfplumber versions expose "chars" with fontname
-                    for char in page.chars:
-                        fname = char.get("fontname")
-                        if fname:
-                            fonts[fname] += 1
-                except Exception:
-                    # Safe fallback if 'chars' not available
-                    pass
-    except Exception:
-        pass
-
-    # --- Images (logos) via PyMuPDF ---
+    # Single PyMuPDF pass: get_text("dict") exposes spans with their font name,
+    # so text, fonts and images all come from one open/traversal of the PDF.
     try:
         doc = fitz.open(path)
         base_dir = os.path.dirname(path) or "."
@@ -120,17 +183,44 @@ def _extract_from_pdf(path: str) -> Tuple[List[str], Counter, List[str]]:
 
         for page_index in range(len(doc)):
             page = doc[page_index]
+
+            # --- Text & Fonts ---
+            try:
+                page_dict = page.get_text("dict")
+            except Exception:
+                page_dict = {}
+            span_texts: List[str] = []
+            for block in page_dict.get("blocks", ()):
+                for line in block.get("lines", ()):
+                    for span in line.get("spans", ()):
+                        fname = span.get("font")
+                        if fname:
+                            fonts[fname] += 1
+                        span_texts.append(span.get("text", ""))
+            for c in extract_hex_colors_from_text(" ".join(span_texts)):
+                hex_colors.add(c)
+
+            # --- Images (logos) ---
+            # Only note size/xref here; decoding and saving every embedded
+            # image is wasted work when a handful of candidates is enough.
             img_list = page.get_images(full=True)
             for img_index, img in enumerate(img_list):
-                xref = img[0]
-                pix = fitz.Pixmap(doc, xref)
-                if pix.n > 4:  # handle CMYK
-                    pix = fitz.Pixmap(fitz.csRGB, pix)
-                out_name = f"pdf_p{page_index}_img{img_index}.png"
-                out_path = os.path.join(logo_out_dir, safe_filename(out_name))
-                pix.save(out_path)
-                image_paths.append(out_path)
-                pix = None
+                xref, img_width, img_height = img[0], img[2], img[3]
+                image_refs.append((img_width * img_height, page_index, img_index, xref))
+
+        # Decode and save only the largest candidates: the caller uses the
+        # first as the logo, and the cap keeps a pathological PDF from
+        # flooding the output directory with PNG writes.
+        image_refs.sort(key=lambda r: r[0], reverse=True)
+        for _, page_index, img_index, xref in image_refs[:MAX_IMAGES_PER_PDF]:
+            pix = fitz.Pixmap(doc, xref)
+            if pix.n > 4:  # handle CMYK
+                pix = fitz.Pixmap(fitz.csRGB, pix)
+            out_name = f"pdf_p{page_index}_img{img_index}.png"
+            out_path = os.path.join(logo_out_dir, safe_filename(out_name))
+            pix.save(out_path)
+            image_paths.append(out_path)
+            pix = None
     except Exception:
         pass
 
@@ -144,24 +234,33 @@ def _extract_from_docx(path: str) -> List[str]:
     hex_colors = set()
     try:
         doc = Document(path)
-        for para in doc.paragraphs:
-            text = para.text or ""
-            for c in extract_hex_colors_from_text(text):
-                hex_colors.add(c)
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    text = cell.text or ""
-                    for c in extract_hex_colors_from_text(text):
-                        hex_colors.add(c)
+        # One joined scan amortizes the regex overhead that per-paragraph /
+        # per-cell calls would pay on every tiny string.
+        all_text = "\n".join(
+            [para.text or "" for para in doc.paragraphs]
+            + [
+                cell.text or ""
+                for table in doc.tables
+                for row in table.rows
+                for cell in row.cells
+            ]
+        )
+        hex_colors = set(extract_hex_colors_from_text(all_text))
     except Exception:
         pass
     return sorted(hex_colors)
 
 
+_FONT_STYLE_SUFFIXES = re.compile(r"Bold|Regular|Italic|Light|Medium")
+
+
+@lru_cache(maxsize=1024)
 def _font_family_from_pdf_name(font_name: str) -> str:
     """
     Attempt to turn PDF internal font name into a usable CSS font-family.
+
+    Pure function; cached because the same PDF font names recur across
+    every document extracted for a brand.
     """
     if not font_name:
         return "Inter, system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif"
@@ -170,7 +269,7 @@ def _font_family_from_pdf_name(font_name: str) -> str:
     parts = font_name.split("+", 1)
     fam = parts[-1]
     # Strip style suffixes e.g. "Bold", "Regular"
-    fam = fam.replace("Bold", "").replace("Regular", "").strip()
+    fam = _FONT_STYLE_SUFFIXES.sub("", fam).strip()
     if not fam:
         fam = "Inter"
 
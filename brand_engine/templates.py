@@ -1,22 +1,46 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Tuple
+
+from markupsafe import escape
+
 from .brand_profile import BrandProfile
 
 
 def generate_letterhead_template(profile: BrandProfile) -> str:
     profile.ensure_palette()
 
-    primary = profile.primary_color or "#0B1120"
-    secondary = profile.secondary_color or "#2563EB"
-    accent = profile.accent_color or "#0EA5E9"
-    bg = profile.background_color or "#F9FAFB"
-    neutral = profile.neutral_color or "#111827"
+    # The template only varies with these fields, so the expensive string
+    # assembly is memoized per distinct brand.
+    return _build_letterhead(
+        profile.primary_color or "#0B1120",
+        profile.secondary_color or "#2563EB",
+        profile.accent_color or "#0EA5E9",
+        profile.background_color or "#F9FAFB",
+        profile.neutral_color or "#111827",
+        profile.font_heading,
+        profile.font_body,
+        profile.logo_path,
+    )
+
 
+@lru_cache(maxsize=128)
+def _build_letterhead(
+    primary: str,
+    secondary: str,
+    accent: str,
+    bg: str,
+    neutral: str,
+    font_heading: str,
+    font_body: str,
+    logo_path: str | None,
+) -> str:
     logo_html = ""
-    if profile.logo_path:
+    if logo_path:
         # In FastMCP Cloud this is typically a file path; the Tri-Tender client
         # can rewrite/serve this path as a URL if needed.
-        logo_html = f'<img src="{profile.logo_path}" alt="Logo" class="brand-logo" />'
+        logo_html = f'<img src="{logo_path}" alt="Logo" class="brand-logo" />'
 
     return f"""<!DOCTYPE html>
 <html lang="en">
@@ -31,8 +55,8 @@ def generate_letterhead_template(profile: BrandProfile) -> str:
       --brand-neutral: {neutral};
       --brand-bg: {bg};
 
-      --font-heading: {profile.font_heading};
-      --font-body: {profile.font_body};
+      --font-heading: {font_heading};
+      --font-body: {font_body};
     }}
 
     * {{
@@ -211,26 +235,69 @@ def generate_letterhead_template(profile: BrandProfile) -> str:
 """
 
 
+# The two slots this module fills itself; the rest (company_name,
+# tender_ref, ...) belong to the Tri-Tender client and stay verbatim.
+_TITLE_SLOT = '{{ title | default("Tri-Tender Document") }}'
+_BODY_SLOT = "{{ body_html | safe }}"
+
+
+@lru_cache(maxsize=128)
+def _letterhead_parts(template_src: str) -> Tuple[str, str, str]:
+    """Split the letterhead once per distinct brand at the title and body
+    slots, so wrapping a document is three concatenations. The letterhead
+    is never compiled or evaluated as a template on the server: profile
+    fields are client data, and feeding them through a template engine
+    would let a crafted profile execute template expressions."""
+    pre_title, _, rest = template_src.partition(_TITLE_SLOT)
+    mid, _, tail = rest.partition(_BODY_SLOT)
+    return pre_title, mid, tail
+
+
 def wrap_body_in_letterhead(profile: BrandProfile, body_html: str, title: str = "Tri-Tender Document") -> str:
     """
-    Render a full HTML document by injecting `body_html` into the letterhead template.
+    Render a full HTML document by injecting `body_html` into the letterhead
+    template. The title is HTML-escaped; `body_html` is trusted markup and
+    inserted as-is. The remaining slots (company_name, tender_ref, ...) are
+    left in place for the client to fill.
     """
-    # For now we use simple string replacement of a placeholder. In a more advanced
-    # setup you can plug any template engine (Jinja, etc.).
-    template = generate_letterhead_template(profile)
-    return template.replace("{{{{ body_html | safe }}}}", body_html).replace(
-        "{{{{ title | default(\"Tri-Tender Document\") }}}}", title
-    )
+    # Pass-through for callers that hand us an already-wrapped document
+    if body_html and (
+        body_html.lstrip()[:9].lower() == "<!doctype" or "<html" in body_html[:200].lower()
+    ):
+        return body_html
+
+    head, mid, tail = _letterhead_parts(generate_letterhead_template(profile))
+    return head + str(escape(title)) + mid + body_html + tail
 
 
 def generate_graph_style_guide(profile: BrandProfile) -> dict:
     """
     Returns a graph style guide based on the brand profile.
+
+    The guide is memoized per brand and shared between callers; treat it
+    as read-only.
     """
     profile.ensure_palette()
+    return _graph_style(
+        tuple(profile.chart_palette),
+        profile.background_color,
+        profile.primary_color,
+        profile.font_heading,
+        profile.font_body,
+    )
+
+
+@lru_cache(maxsize=64)
+def _graph_style(
+    chart_palette: tuple,
+    background_color: str | None,
+    primary_color: str | None,
+    font_heading: str,
+    font_body: str,
+) -> dict:
     return {
-        "series_colors": profile.chart_palette,
-        "background": profile.background_color or "#FFFFFF",
+        "series_colors": list(chart_palette),
+        "background": background_color or "#FFFFFF",
         "grid_color": "#E5E7EB",
         "axis": {
             "color": "#4B5563",
@@ -238,12 +305,12 @@ def generate_graph_style_guide(profile: BrandProfile) -> dict:
         },
         "label": {
             "color": "#111827",
-            "font_family": profile.font_body,
+            "font_family": font_body,
             "font_size": 12,
         },
         "title": {
-            "color": profile.primary_color or "#0B1120",
-            "font_family": profile.font_heading,
+            "color": primary_color or "#0B1120",
+            "font_family": font_heading,
             "font_size": 16,
             "font_weight": 700,
         },
@@ -13,7 +13,7 @@ Responsibilities:
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import asyncio
 from typing import List, Dict, Any
 
 from fastmcp import FastMCP
@@ -40,7 +40,7 @@ mcp = FastMCP("tri-tender-brand-letterhead-mcp")
 
 
 @mcp.tool()
-async def build_brand_profile(file_paths: List[str]) -> Dict[str, Any]:
+async def build_brand_profile(file_paths: List[str]) -> BrandProfile:
     """
     Analyze the given brand assets and return a BrandProfile.
 
@@ -49,30 +49,33 @@ async def build_brand_profile(file_paths: List[str]) -> Dict[str, Any]:
                     accessible to this MCP server (e.g. via FastMCP Cloud).
 
     Returns:
-        Dict representing the BrandProfile.
+        The BrandProfile (serialized to the same JSON shape as a dict).
     """
-    profile: BrandProfile = extract_brand_from_files(file_paths)
-    return asdict(profile)
+    # Extraction is CPU-bound (and already fans out over a process pool for
+    # multi-file kits); run it off the event loop so other tool calls are not
+    # starved while a brand kit is being analyzed.
+    # FastMCP serializes dataclasses directly, so there is no asdict() deep
+    # copy on the way out.
+    return await asyncio.to_thread(extract_brand_from_files, file_paths)
 
 
 @mcp.tool()
-async def get_letterhead_template(brand_profile: Dict[str, Any]) -> str:
+async def get_letterhead_template(brand_profile: BrandProfile) -> str:
     """
     Generate an HTML letterhead template using BrandProfile CSS tokens.
 
     Args:
-        brand_profile: A BrandProfile dict (e.g. from build_brand_profile).
+        brand_profile: A BrandProfile (dict payloads are validated by FastMCP).
 
     Returns:
         HTML string containing a styled letterhead template.
     """
-    profile = BrandProfile.from_dict(brand_profile)
-    return generate_letterhead_template(profile)
+    return generate_letterhead_template(brand_profile)
 
 
 @mcp.tool()
 async def render_letter_with_body(
-    brand_profile: Dict[str, Any],
+    brand_profile: BrandProfile,
     body_html: str,
     title: str = "Tri-Tender Document",
 ) -> str:
@@ -87,12 +90,11 @@ async def render_letter_with_body(
     Returns:
         Full HTML document as a string.
     """
-    profile = BrandProfile.from_dict(brand_profile)
-    return wrap_body_in_letterhead(profile, body_html, title=title)
+    return wrap_body_in_letterhead(brand_profile, body_html, title=title)
 
 
 @mcp.tool()
-async def get_graph_style(brand_profile: Dict[str, Any]) -> Dict[str, Any]:
+async def get_graph_style(brand_profile: BrandProfile) -> Dict[str, Any]:
     """
     Return a graph style guide for charts (series colors, fonts, etc.).
 
@@ -102,13 +104,12 @@ async def get_graph_style(brand_profile: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Graph style guide as dict.
     """
-    profile = BrandProfile.from_dict(brand_profile)
-    return generate_graph_style_guide(profile)
+    return generate_graph_style_guide(brand_profile)
 
 
 @mcp.tool()
 async def build_bar_chart_svg(
-    brand_profile: Dict[str, Any],
+    brand_profile: BrandProfile,
     series: List[Dict[str, Any]],
     title: str = "",
     width: int = 800,
@@ -127,13 +128,12 @@ async def build_bar_chart_svg(
     Returns:
         SVG XML string.
     """
-    profile = BrandProfile.from_dict(brand_profile)
-    return generate_bar_chart_svg(profile, series, title=title, width=width, height=height)
+    return generate_bar_chart_svg(brand_profile, series, title=title, width=width, height=height)
 
 
 @mcp.tool()
 async def build_bar_chart_png(
-    brand_profile: Dict[str, Any],
+    brand_profile: BrandProfile,
     series: List[Dict[str, Any]],
     title: str = "",
     width: int = 800,
@@ -152,12 +152,11 @@ async def build_bar_chart_png(
     Returns:
         A data URL string: "data:image/png;base64,...."
     """
-    profile = BrandProfile.from_dict(brand_profile)
-    return generate_bar_chart_png_base64(profile, series, title=title, width=width, height=height)
+    return generate_bar_chart_png_base64(brand_profile, series, title=title, width=width, height=height)
 
 
 @mcp.tool()
-async def generate_brand_book(brand_profile: Dict[str, Any]) -> Dict[str, str]:
+async def generate_brand_book(brand_profile: BrandProfile) -> Dict[str, str]:
     """
     Generate a Brand Book summarizing all brand elements inferred for the client.
 
@@ -168,9 +167,13 @@ async def generate_brand_book(brand_profile: Dict[str, Any]) -> Dict[str, str]:
     This is ideal to store in Tri-Tender's project space as a brand reference,
     and to share with the client as a polished brand kit.
     """
-    profile = BrandProfile.from_dict(brand_profile)
-    html = generate_brand_book_html(profile)
-    pdf_data_url = generate_brand_book_pdf_data_url(profile, html)
+    html = generate_brand_book_html(brand_profile)
+    # The PDF render (reportlab flowable layout + base64) is the long pole
+    # here; run it on the default executor so concurrent tool calls are not
+    # blocked behind it.
+    pdf_data_url = await asyncio.to_thread(
+        generate_brand_book_pdf_data_url, brand_profile, html
+    )
     return {
         "html": html,
         "pdf_data_url": pdf_data_url,